@@ -1,11 +1,42 @@
-import pyfiglet
-from termcolor import colored
+import os
+
+# Pre-rendered output of pyfiglet.figlet_format("QRGen Tool", font="jazmine"),
+# so startup doesn't have to load and render a figlet font. Set
+# QRGEN_REGEN_BANNER=1 to render it with pyfiglet instead (e.g. to update it).
+_BANNER = (
+    '                                                            \n'
+    '.oPYo.   .oPYo. .oPYo.                ooooo               8 \n'
+    '8    8   8   `8 8    8                  8                 8 \n'
+    "8    8  o8YooP' 8      .oPYo. odYo.     8   .oPYo. .oPYo. 8 \n"
+    "8  d.8   8   `b 8   oo 8oooo8 8' `8     8   8    8 8    8 8 \n"
+    '8  `b8.  8    8 8    8 8.     8   8     8   8    8 8    8 8 \n'
+    "`YooP'P  8    8 `YooP8 `Yooo' 8   8     8   `YooP' `YooP' 8 \n"
+    ':....:.::..:::..:....8 :.....:..::..::::..:::.....::.....:..\n'
+    ':::::::::::::::::::::8 :::::::::::::::::::::::::::::::::::::\n'
+    ':::::::::::::::::::::..:::::::::::::::::::::::::::::::::::::\n'
+)
+
+_GREEN = "\x1b[32m"
+_WHITE = "\x1b[97m"
+_RESET = "\x1b[0m"
+
+def _color(text, code):
+    # Same rules as termcolor: ANSI_COLORS_DISABLED / NO_COLOR turn colors
+    # off, FORCE_COLOR turns them on, otherwise only color a terminal
+    if os.environ.get("ANSI_COLORS_DISABLED") or os.environ.get("NO_COLOR"):
+        return text
+    if not os.environ.get("FORCE_COLOR") and not os.isatty(1):
+        return text
+    return code + text + _RESET
 
 def show_banner():
-    banner = pyfiglet.figlet_format("QRGen Tool", font="jazmine")
-    print(colored(banner, "green"))
+    banner = _BANNER
+    if os.environ.get("QRGEN_REGEN_BANNER"):
+        import pyfiglet
+        banner = pyfiglet.figlet_format("QRGen Tool", font="jazmine")
+    print(_color(banner, _GREEN))
     print(" QR Code Generator Tool - Convert Files/URLs to QR Codes")
     print()
-    print(colored("👤 Author: Richard | GitHub: Richardpandey", "green"))
+    print(_color("👤 Author: Richard | GitHub: Richardpandey", _GREEN))
     print()
-    print(colored("------------------------------------------------------------\n", "white"))
+    print(_color("------------------------------------------------------------\n", _WHITE))
@@ -0,0 +1,206 @@
+"""Speed-ups for the pure-Python `qrcode` library.
+
+`qrcode` builds its data stream one bit at a time into a list of bytes. This
+module provides a drop-in BitBuffer backed by a single Python integer, so each
+`put()` is one shift-or instead of a loop of per-bit calls. Importing the
+module installs it in place of `qrcode.util.BitBuffer`.
+
+It also provides a QRCode subclass that picks the mask pattern using cached
+per-version mask rows: each candidate matrix is derived from one placement
+with a big-integer XOR per row rather than a per-module mask callable. The
+candidates are scored by `lost_point`, which computes all four penalty rules
+in one pass over the rows and one over the columns (also installed in place of
+`qrcode.util.lost_point`).
+
+The generated symbols are bit-for-bit identical to the library's own.
+"""
+
+import re  # Run-length matching for the penalty rules
+import qrcode  # Base QRCode class we specialize
+import qrcode.util  # Library internals we replace with faster equivalents
+
+
+class BitBuffer:
+    """Append-only bit buffer stored as one big integer (MSB first)."""
+
+    def __init__(self):
+        self.bits = 0
+        self.length = 0
+        # (length, bytes) of the last materialized `buffer`, see below
+        self._cache = (-1, b"")
+
+    def __repr__(self):
+        return ".".join([str(n) for n in self.buffer])
+
+    def __len__(self):
+        return self.length
+
+    def get(self, index):
+        return ((self.bits >> (self.length - index - 1)) & 1) == 1
+
+    def put(self, num, length):
+        # Keep only the low `length` bits, as the original per-bit loop does
+        self.bits = (self.bits << length) | (num & ((1 << length) - 1))
+        self.length += length
+
+    def put_bit(self, bit):
+        self.bits = (self.bits << 1) | (1 if bit else 0)
+        self.length += 1
+
+    @property
+    def buffer(self):
+        """Return the bits as bytes, zero-padding the final partial byte.
+
+        The library only reads this once the stream is complete, and indexes
+        it byte by byte, so the conversion is cached until more bits are put.
+        """
+        if self._cache[0] != self.length:
+            pad = -self.length % 8
+            data = (self.bits << pad).to_bytes((self.length + pad) // 8, "big")
+            self._cache = (self.length, data)
+        return self._cache[1]
+
+
+# Used by both QRCode.best_fit and util.create_data via the module global
+qrcode.util.BitBuffer = BitBuffer
+
+
+# Penalty rule 1: runs of 5 or more same-colored modules
+_RUN_PATTERN = re.compile(rb"\x00{5,}|\x01{5,}")
+
+# Penalty rule 3: finder-like 1:1:3:1:1 patterns with 4 light modules on
+# either side. Neither can overlap itself or the other, so bytes.count is exact.
+_FINDER_PATTERNS = (
+    bytes((1, 0, 1, 1, 1, 0, 1, 0, 0, 0, 0)),
+    bytes((0, 0, 0, 0, 1, 0, 1, 1, 1, 0, 1)),
+)
+
+
+def _lost_point_lines(lines):
+    """Return the rule 1 and rule 3 penalties for a sequence of rows/columns."""
+    pattern1, pattern2 = _FINDER_PATTERNS
+    lost_point = 0
+    for line in lines:
+        for run in _RUN_PATTERN.finditer(line):
+            lost_point += run.end() - run.start() - 2
+        lost_point += 40 * (line.count(pattern1) + line.count(pattern2))
+    return lost_point
+
+
+def _lost_point(modules):
+    """Score a matrix given as rows of bytes (one 0/1 byte per module).
+
+    Gives the same total as `qrcode.util.lost_point`. Rules 1 and 3 are
+    matched on the rows and then the columns. Rule 2 (2x2 blocks) and rule 4
+    (dark module ratio) are accumulated during the row pass, using integer
+    arithmetic on each pair of adjacent rows.
+    """
+    modules_count = len(modules)
+    all_ones = int.from_bytes(b"\x01" * modules_count, "big")
+    # Every module except the first in a row, i.e. those with a left neighbor
+    with_left = all_ones >> 8
+
+    lost_point = _lost_point_lines(modules)
+
+    dark_count = 0
+    blocks = 0
+    previous = None
+    for row in modules:
+        dark_count += row.count(1)
+        current = int.from_bytes(row, "big")
+        if previous is not None:
+            # 1 where the module matches the one above it
+            same_vertical = (current ^ previous) ^ all_ones
+            # 1 where the module matches the one to its left
+            same_horizontal = ((current ^ (current >> 8)) & with_left) ^ with_left
+            # bin().count rather than int.bit_count(), which needs Python 3.10
+            blocks += bin(same_vertical & (same_vertical >> 8) & same_horizontal).count("1")
+        previous = current
+    lost_point += blocks * 3
+
+    lost_point += _lost_point_lines(bytes(column) for column in zip(*modules))
+
+    percent = float(dark_count) / (modules_count**2)
+    # Every 5% departure from 50%, rating++
+    lost_point += int(abs(percent * 100 - 50) / 5) * 10
+
+    return lost_point
+
+
+def lost_point(modules):
+    """Drop-in for `qrcode.util.lost_point` accepting any 0/1 row sequences."""
+    return _lost_point([bytes(row) for row in modules])
+
+
+qrcode.util.lost_point = lost_point
+
+
+# Per-version caches. Rows are stored as integers holding one byte (0 or 1)
+# per module, so `int.to_bytes` turns them back into a row of the matrix.
+# Data regions mark the modules that carry (maskable) data bits; mask rows are
+# the 8 standard mask patterns already restricted to those data regions.
+_DATA_REGIONS = {}
+_MASK_ROWS = {}
+
+
+def _mask_rows(version):
+    """Return the 8 data-region mask patterns for a version, as row integers."""
+    if version not in _MASK_ROWS:
+        region = _DATA_REGIONS[version]
+        modules_range = range(len(region))
+        masks = []
+        for pattern in range(8):
+            mask_func = qrcode.util.mask_func(pattern)
+            masks.append([
+                int.from_bytes(bytes(mask_func(row, col) for col in modules_range), "big") & region[row]
+                for row in modules_range
+            ])
+        _MASK_ROWS[version] = masks
+    return _MASK_ROWS[version]
+
+
+class QRCode(qrcode.QRCode):
+    """QRCode that evaluates mask candidates with whole-row XORs."""
+
+    def map_data(self, data, mask_pattern):
+        # Before the first placement for a version, every module still set to
+        # None is a data module; remember where they are.
+        if self.version not in _DATA_REGIONS:
+            _DATA_REGIONS[self.version] = [
+                int.from_bytes(bytes(module is None for module in row), "big")
+                for row in self.modules
+            ]
+        super().map_data(data, mask_pattern)
+
+    def best_mask_pattern(self):
+        """Find the most efficient mask pattern.
+
+        Data is placed once (with mask 0); in test mode the format and version
+        areas are blank for every mask, so the candidates differ only in the
+        data modules and each can be produced by XOR-ing the mask rows.
+        """
+        self.makeImpl(True, 0)
+        modules_count = self.modules_count
+        masks = _mask_rows(self.version)
+
+        # Undo mask 0 once so every candidate is a single XOR per row
+        unmasked = [
+            int.from_bytes(bytes(row), "big") ^ mask_row
+            for row, mask_row in zip(self.modules, masks[0])
+        ]
+
+        min_lost_point = 0
+        pattern = 0
+
+        for i, mask in enumerate(masks):
+            modules = [
+                (row ^ mask_row).to_bytes(modules_count, "big")
+                for row, mask_row in zip(unmasked, mask)
+            ]
+            lost_point = _lost_point(modules)
+
+            if i == 0 or min_lost_point > lost_point:
+                min_lost_point = lost_point
+                pattern = i
+
+        return pattern
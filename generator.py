@@ -1,17 +1,19 @@
 """QR code generation helpers.
 
 This module provides small utility functions for generating QR codes from:
-- A raw URL string
+- A raw URL string (pass it straight to generate_qr)
 - Text file contents
 - Binary file contents (base64-encoded before embedding)
 
-It also exposes a helper to estimate the maximum binary payload size that can
+It also exposes a helper to compute the maximum binary payload size that can
 fit in a single QR symbol once base64 overhead is accounted for.
 """
 
-import qrcode  # Third-party library for creating QR codes
+# Heavier modules (qrcode and friends, base64, mmap) are imported inside the
+# functions that need them, so importing this module (e.g. just to show the
+# CLI menu) stays cheap.
 import os  # Filesystem utilities (path operations and file size)
-import base64  # For encoding binary data into text (base64)
+import io  # In-memory buffer for the encoded image
 
 # Constants
 # Approximate maximum number of bytes that can be stored in a single QR symbol
@@ -19,46 +21,92 @@ import base64  # For encoding binary data into text (base64)
 # used here as a practical upper bound for plain text content.
 MAX_QR_CAPACITY = 2953
 
-# Multiplicative overhead when converting raw bytes to base64 text. Base64
-# typically expands data by ~4/3 (≈1.33x), ignoring minor padding differences.
-BASE64_OVERHEAD = 1.33
+# Largest binary file (in bytes) that still fits once base64 encoded. Base64
+# emits exactly 4 * ceil(n / 3) characters for n input bytes, so the largest n
+# whose encoding fits in the raw QR capacity is 3 * (capacity // 4).
+MAX_FILE_SIZE = (MAX_QR_CAPACITY // 4) * 3
+
+# A small allowlist of typical text file extensions, used to tell text files
+# apart from binary ones
+TEXT_EXTENSIONS = frozenset({'.txt', '.py', '.js', '.html', '.css', '.json', '.xml', '.csv', '.md'})
 
 def calculate_max_file_size():
     """Return max binary file size (in bytes) that fits after base64 encoding.
 
-    We estimate by dividing the raw QR capacity by the base64 expansion factor.
-    This is used for binary files since they are encoded to base64 before
-    embedding in the QR code.
+    Kept for callers of the original helper; the value is precomputed once as
+    MAX_FILE_SIZE since it only depends on module constants.
     """
-    return int(MAX_QR_CAPACITY / BASE64_OVERHEAD)
+    return MAX_FILE_SIZE
 
-def generate_qr(data, output_file, is_binary=False):
-    """Create and save a QR code image from the provided data string.
+# Shared QRCode object reused across calls, see _get_qr()
+_QR = None
 
-    Parameters:
-    - data: str — the text content to embed in the QR symbol.
-    - output_file: str — path where the generated image (PNG) will be saved.
-    - is_binary: bool — whether the source was binary (affects user messaging).
+def _get_qr():
+    """Return the shared QRCode object, reset and ready for new data.
 
-    Returns True on success, False on error (and prints a message).
+    Reusing one object avoids rebuilding it for every QR code in a batch. Not
+    thread-safe; batch mode uses processes, each with its own instance.
     """
-    try:
-        # Build a QRCode object; version=None lets the library pick the minimum
-        # size that can fit the provided data at the chosen error correction.
-        qr = qrcode.QRCode(
+    global _QR
+    if _QR is None:
+        import qrcode  # Third-party library for creating QR codes
+        import fastqr  # Faster QRCode subclass; also installs faster qrcode internals
+
+        # version=None lets the library pick the minimum size that can fit
+        # the provided data at the chosen error correction.
+        _QR = fastqr.QRCode(
             version=None,
             error_correction=qrcode.constants.ERROR_CORRECT_L,
             box_size=10,
             border=4,
         )
+    else:
+        # clear() drops the data but keeps the fitted version, which would
+        # become the starting point for the next fit
+        _QR.clear()
+        _QR.version = None
+    return _QR
+
+def generate_qr(data, output_file, is_binary=False):
+    """Create and save a QR code image from the provided data.
+
+    Parameters:
+    - data: str | bytes — the content to embed in the QR symbol. Bytes are
+      embedded as-is; strings are UTF-8 encoded by the library.
+    - output_file: str — path where the generated image will be saved. Paths
+      ending in .svg get an SVG image; anything else is saved as PNG.
+    - is_binary: bool — whether the source was binary (affects user messaging).
+
+    Returns True on success, False on error (and prints a message).
+    """
+    try:
+        qr = _get_qr()
 
-        # Add the payload and let the library compute the optimal layout
-        qr.add_data(data)
+        # Add the payload as a single byte-mode segment (no mixed-mode
+        # splitting) and let the library compute the optimal layout
+        qr.add_data(data, optimize=0)
         qr.make(fit=True)
 
-        # Render to a PIL image and write it to disk
-        img = qr.make_image(fill_color="black", back_color="white")
-        img.save(output_file)
+        if output_file.lower().endswith('.svg'):
+            # Vector output: a single compacted <path>, no rasterization.
+            # Imported here so PNG runs never load the SVG/XML stack.
+            import qrcode.image.svg  # SVG image factory for .svg output paths
+
+            img = qr.make_image(image_factory=qrcode.image.svg.SvgPathImage)
+            img.save(output_file)
+        else:
+            # Render to a PIL image, encode the PNG in memory and write it to
+            # disk in one go instead of chunk by chunk through PIL's file layer.
+            # QR images are low-entropy black/white, so the fastest zlib level
+            # compresses nearly as well as the default. With black/white
+            # colors the image is kept in PIL's 1-bit mode, so only 1 bit per
+            # pixel goes through zlib; this is faster than qrcode's pure-Python
+            # PyPNGImage writer.
+            img = qr.make_image(fill_color="black", back_color="white")
+            buffer = io.BytesIO()
+            img.save(buffer, format="PNG", compress_level=1, optimize=False)
+            with open(output_file, 'wb') as file:
+                file.write(buffer.getbuffer())
         
         if is_binary:
             print(f"[+] QR code successfully generated from binary file and saved as {output_file}")
@@ -71,10 +119,6 @@ def generate_qr(data, output_file, is_binary=False):
         print(f"[-] Error generating QR code: {e}")
         return False
 
-def generate_qr_from_url(url, output_file="qrcode.png"):
-    """Generate a QR code directly from a URL string."""
-    return generate_qr(url, output_file)
-
 def generate_qr_from_text_file(file_path, output_file="qrcode.png"):
     """Read a text file and encode its contents into a QR code image.
 
@@ -83,24 +127,35 @@ def generate_qr_from_text_file(file_path, output_file="qrcode.png"):
     capacity (MAX_QR_CAPACITY) is used for size checking.
     """
     try:
-        # A small allowlist of typical text file extensions
-        text_extensions = ['.txt', '.py', '.js', '.html', '.css', '.json', '.xml', '.csv', '.md']
         file_ext = os.path.splitext(file_path)[1].lower()
         
-        if file_ext not in text_extensions:
+        if file_ext not in TEXT_EXTENSIONS:
             print(f"[-] Error: Not a text file. Detected: {file_ext}. Use option 3 for binary files.")
             return False
         
-        # Read text content as UTF-8. If this fails, we treat it as binary.
-        with open(file_path, 'r', encoding='utf-8') as file:
+        # Reject oversized files before reading them. The raw bytes are what
+        # gets embedded, so the on-disk size is compared against capacity;
+        # the length is checked again after reading in case the file changed.
+        file_size = os.path.getsize(file_path)
+        if file_size > MAX_QR_CAPACITY:
+            print(f"[-] Error: File too large. Max: {MAX_FILE_SIZE/1024:.1f} KB, Your file: {file_size/1024:.1f} KB")
+            return False
+        
+        # Read the raw bytes; they are embedded without a decode/encode round
+        # trip. Pure-ASCII files (the common case for source and data files)
+        # need no further checks; anything else must be valid UTF-8,
+        # otherwise we treat it as binary.
+        with open(file_path, 'rb') as file:
             content = file.read()
         
+        if not content.isascii():
+            content.decode('utf-8')
+        
         # For plain text, compare against raw capacity. Note the printed
         # max value references the base64-adjusted helper (used for binaries).
         # This keeps user-facing guidance consistent across modes.
-        max_size = calculate_max_file_size()
         if len(content) > MAX_QR_CAPACITY:
-            print(f"[-] Error: File too large. Max: {max_size/1024:.1f} KB, Your file: {len(content)/1024:.1f} KB")
+            print(f"[-] Error: File too large. Max: {MAX_FILE_SIZE/1024:.1f} KB, Your file: {len(content)/1024:.1f} KB")
             return False
         
         return generate_qr(content, output_file)
@@ -121,20 +176,26 @@ def generate_qr_from_binary_file(file_path, output_file="qrcode.png"):
     The file size is validated against the base64-adjusted capacity to reduce
     the chance of producing an oversized QR symbol that cannot be rendered.
     """
+    import base64  # For encoding binary data into text (base64)
+    import mmap  # Memory-mapped reads of binary files
+
     try:
-        # Determine raw byte size and the maximum allowed when base64 encoded
+        # Compare the raw byte size with the maximum allowed when base64 encoded
         file_size = os.path.getsize(file_path)
-        max_size = calculate_max_file_size()
         
-        if file_size > max_size:
-            print(f"[-] Error: File too large. Max: {max_size/1024:.1f} KB, Your file: {file_size/1024:.1f} KB")
+        if file_size > MAX_FILE_SIZE:
+            print(f"[-] Error: File too large. Max: {MAX_FILE_SIZE/1024:.1f} KB, Your file: {file_size/1024:.1f} KB")
             return False
         
-        # Read the entire file as bytes and convert to base64 text
-        with open(file_path, 'rb') as file:
-            binary_content = file.read()
-        
-        encoded_content = base64.b64encode(binary_content).decode('utf-8')
+        # Map the file read-only and base64-encode straight from the mapping,
+        # avoiding an intermediate copy of the raw bytes. Empty files cannot
+        # be mapped, but they also have nothing to encode.
+        encoded_content = ''
+        if file_size:
+            with open(file_path, 'rb') as file:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    # base64 output is pure ASCII, so the cheaper ASCII codec is sufficient
+                    encoded_content = base64.b64encode(mapped).decode('ascii')
         return generate_qr(encoded_content, output_file, is_binary=True)
         
     except FileNotFoundError:
@@ -1,44 +1,230 @@
 #!/usr/bin/env python3  # Allows running this script directly on Unix-like systems
 import os  # Standard library module for filesystem and path utilities
+import sys  # Command-line arguments, stdin and exit status for batch mode
+import glob  # Wildcard expansion of input file paths in batch mode
+import argparse  # Command-line parsing for non-interactive (batch) use
+import concurrent.futures  # Process pool for generating batch jobs in parallel
 from banner import show_banner  # Prints the application banner/logo
-from generator import *  # Imports QR generation helpers (URL/text/binary, size calc)
+from generator import (  # QR generation helpers (URL/text/binary) and size limit
+    MAX_FILE_SIZE,
+    generate_qr,
+    generate_qr_from_text_file,
+    generate_qr_from_binary_file,
+)
 
 # This script provides a simple CLI to generate QR codes from:
 # 1) A URL string
 # 2) The contents of a text file
 # 3) The raw bytes of a binary file (within encoder size limits)
 #
-# It prompts the user for inputs, validates basic conditions (e.g., file exists),
-# ensures the output directory exists, and delegates QR creation to functions
-# defined in `generator.py`.
+# Without arguments it prompts the user for inputs, validates basic conditions
+# (e.g., file exists), ensures the output directory exists, and delegates QR
+# creation to functions defined in `generator.py`.
+#
+# With arguments it runs non-interactively, so many QR codes can be generated
+# in one process, e.g.:
+#   python3 main.py --mode binary --input 'docs/*.pdf' --output 'out/{name}.png'
+
+# Default output path template for batch mode. The suffix keeps it from ever
+# resolving to the input file itself (e.g. `--input logo.png`).
+DEFAULT_OUTPUT = "{name}_qr.png"
+
+# Generator function used for each batch mode
+GENERATORS = {
+    "url": generate_qr,
+    "text": generate_qr_from_text_file,
+    "binary": generate_qr_from_binary_file,
+}
+
+def ensure_output_dir(output_file):
+    """Create the directory part of an output path if it doesn't exist yet.
+
+    Returns True when the directory is usable, False on error (and prints a
+    message), e.g. when a regular file sits where a directory should be.
+    """
+    # Extract directory portion (may be empty when only a filename is provided)
+    output_dir = os.path.dirname(output_file)
+
+    # Create the directory if it was specified; exist_ok makes this safe even
+    # if it appears concurrently. The pre-check only decides whether to report.
+    if output_dir:
+        existed = os.path.isdir(output_dir)
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError as e:
+            print(f"[-] Error: Cannot create directory {output_dir}: {e}")
+            return False
+        if not existed:
+            print(f"[+] Created directory: {output_dir}")
+    return True
 
 def get_output_file():
     """Ask for an output image path and create its directory if needed.
 
-    Returns the user-specified path or the default 'qrcode.png' when left blank.
+    Returns the user-specified path or the default 'qrcode.png' when left blank,
+    or None if its directory could not be created.
     """
     # Read a desired output file path; default to 'qrcode.png' when empty
     output_file = input("Output file path (default: qrcode.png): ").strip() or "qrcode.png"
 
-    # Extract directory portion (may be empty when only a filename is provided)
-    output_dir = os.path.dirname(output_file)
-
-    # Create the directory if it was specified and doesn’t exist yet
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"[+] Created directory: {output_dir}")
+    if not ensure_output_dir(output_file):
+        return None
 
     # Return the path (relative or absolute) to be used for the generated QR image
     return output_file
 
-def main():
+def parse_args(argv=None):
+    """Parse command-line options for batch mode."""
+    parser = argparse.ArgumentParser(
+        description="Generate QR codes from URLs, text files or binary files. "
+                    "Run without arguments for the interactive menu.",
+    )
+    parser.add_argument("--mode", choices=sorted(GENERATORS),
+                        help="kind of input to encode")
+    parser.add_argument("--input",
+                        help="comma-separated URLs or file paths (wildcards allowed for files)")
+    parser.add_argument("--output",
+                        help="output path template; {name} is the input file name without "
+                             f"extension (the 1-based position for URLs). Default: {DEFAULT_OUTPUT}")
+    parser.add_argument("--batch-stdin", action="store_true",
+                        help="also read inputs from stdin, one per line")
+    parser.add_argument("--workers", type=int,
+                        help="number of processes for batch generation (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    if (args.input or args.batch_stdin or args.output is not None
+            or args.workers is not None) and not args.mode:
+        parser.error("--mode is required with --input/--batch-stdin/--output/--workers")
+    if args.mode and not (args.input or args.batch_stdin):
+        parser.error("--input or --batch-stdin is required with --mode")
+    if args.workers is None:
+        args.workers = os.cpu_count() or 1
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    if args.mode:
+        if args.output is None:
+            args.output = DEFAULT_OUTPUT
+        # Validate the template up front; {name} is its only placeholder
+        try:
+            args.output.format(name="name")
+        except (KeyError, IndexError, ValueError, AttributeError) as e:
+            parser.error(f"invalid --output template {args.output!r}: {e!r}")
+
+        # Resolve every job before running any of them, so bad combinations
+        # are reported without touching a single file
+        try:
+            args.jobs = build_jobs(args)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
+
+def collect_inputs(args):
+    """Return the list of inputs given via --input and/or stdin."""
+    items = []
+    if args.input:
+        items.extend(item.strip() for item in args.input.split(","))
+    if args.batch_stdin:
+        items.extend(line.strip() for line in sys.stdin)
+    items = [item for item in items if item]
+
+    if args.mode == "url":
+        return items
+
+    # Expand wildcards for file inputs; keep unmatched entries as-is so they
+    # are reported as missing files by the generator
+    inputs = []
+    for item in items:
+        inputs.extend(sorted(glob.glob(item)) or [item])
+    return inputs
+
+def build_jobs(args):
+    """Return (mode, input, output_file) tuples for a batch run.
+
+    Raises ValueError when there is nothing to do, or when an output path
+    would overwrite one of the input files or another job's output.
+    """
+    inputs = collect_inputs(args)
+    if not inputs:
+        raise ValueError("no inputs given")
+
+    # Compare normalized absolute paths so e.g. './a.png' matches 'a.png'
+    def key(path):
+        return os.path.normcase(os.path.realpath(path))
+
+    input_paths = set() if args.mode == "url" else {key(item) for item in inputs}
+    outputs = {}
+    jobs = []
+    for index, item in enumerate(inputs, start=1):
+        if args.mode == "url":
+            name = str(index)
+        else:
+            name = os.path.splitext(os.path.basename(item))[0]
+        # The up-front check in parse_args uses a dummy name; indexing or
+        # attribute fields (e.g. {name[3]}) can still fail on a real one
+        try:
+            output_file = args.output.format(name=name)
+        except (KeyError, IndexError, ValueError, AttributeError) as e:
+            raise ValueError(f"invalid --output template {args.output!r} for input {item}: {e!r}")
+
+        output_key = key(output_file)
+        if output_key in input_paths:
+            raise ValueError(f"output {output_file} would overwrite an input file; "
+                             "use a different --output template")
+        if output_key in outputs:
+            raise ValueError(f"inputs {outputs[output_key]} and {item} would both be "
+                             f"written to {output_file}; use a different --output template")
+        outputs[output_key] = item
+
+        jobs.append((args.mode, item, output_file))
+    return jobs
+
+def _generate_one(job):
+    """Run a single batch job; module-level so worker processes can pickle it."""
+    mode, item, output_file = job
+    ok = GENERATORS[mode](item, output_file)
+    if not ok:
+        # The generators' messages don't name the input; say which one failed
+        print(f"[-] Failed: {item}")
+    return ok
+
+def run_batch(args):
+    """Generate a QR code for every input. Returns True if all succeeded.
+
+    Each QR code is independent and CPU-bound, so multiple jobs are spread
+    over a pool of worker processes. This relies on every job having its own
+    output file, which parse_args/build_jobs verify before we get here; jobs
+    sharing a file would otherwise race each other writing it.
+    """
+    # Create output directories up front, in this process, so workers never
+    # race each other creating the same directory. Jobs whose directory
+    # cannot be created are skipped and count as failures.
+    jobs = [job for job in args.jobs if ensure_output_dir(job[2])]
+    ok = len(jobs) == len(args.jobs)
+
+    workers = min(args.workers, len(jobs))
+    if workers <= 1:
+        return all([_generate_one(job) for job in jobs]) and ok
+
+    # Hand out jobs in chunks to amortize the inter-process overhead
+    chunksize = max(1, len(jobs) // (4 * workers))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return all(list(executor.map(_generate_one, jobs, chunksize=chunksize))) and ok
+
+def main(argv=None):
     """Entry point for the CLI menu and QR code generation workflow."""
+    # Batch mode: generate everything requested on the command line and exit
+    args = parse_args(argv)
+    if args.mode:
+        if not run_batch(args):
+            sys.exit(1)
+        return
+
     # Display the app banner for a friendly CLI experience
     show_banner()
 
-    # Determine the maximum supported payload size from the encoder
-    max_size = calculate_max_file_size()
-    print(f"[i] Maximum file size: {max_size/1024:.1f} KB\n")
+    # Maximum supported payload size, precomputed by the generator module
+    print(f"[i] Maximum file size: {MAX_FILE_SIZE/1024:.1f} KB\n")
 
     # Present options for what to encode into a QR code
     print("Options:")
@@ -53,8 +239,11 @@ def main():
         # Option 1: Encode a URL string as a QR code image
         url = input("Enter URL: ").strip()
         if url:
-            # Prompt for output path and generate the PNG
-            generate_qr_from_url(url, get_output_file())
+            # Prompt for output path and generate the PNG (skipped when the
+            # output directory could not be created; already reported)
+            output_file = get_output_file()
+            if output_file:
+                generate_qr(url, output_file)
         else:
             # Simple validation for empty input
             print("[-] URL cannot be empty!")
@@ -63,7 +252,9 @@ def main():
         # Option 2: Read a text file’s content and encode it
         file_path = input("Enter text file path: ").strip()
         if file_path and os.path.exists(file_path):
-            generate_qr_from_text_file(file_path, get_output_file())
+            output_file = get_output_file()
+            if output_file:
+                generate_qr_from_text_file(file_path, output_file)
         else:
             # File path was empty or the file does not exist
             print("[-] File not found!")
@@ -72,7 +263,9 @@ def main():
         # Option 3: Read raw bytes from a binary file and encode them
         file_path = input("Enter binary file path: ").strip()
         if file_path and os.path.exists(file_path):
-            generate_qr_from_binary_file(file_path, get_output_file())
+            output_file = get_output_file()
+            if output_file:
+                generate_qr_from_binary_file(file_path, output_file)
         else:
             # File path was empty or the file does not exist
             print("[-] File not found!")